@@ -1,8 +1,8 @@
 """
 Research Controller - 調査実行の制御
 """
-import json
 import time
+import orjson
 import logging
 from pathlib import Path
 from datetime import datetime
@@ -243,13 +243,12 @@ class ResearchController:
         """フェーズ設定の読み込み"""
         config_path = self.root_dir / "config" / "phase_config.json"
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                all_phases = json.load(f)
+            all_phases = orjson.loads(config_path.read_bytes())
             return all_phases.get(phase_name, {})
         except FileNotFoundError as e:
             logger.error(f"フェーズ設定ファイルが見つかりません: {config_path}")
             raise
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"フェーズ設定ファイルのJSON形式が不正: {e}")
             raise
         except Exception as e:
@@ -276,8 +275,12 @@ class ResearchController:
                 for theme_id, data in results.items()
             }
 
-            with open(results_file, "w", encoding="utf-8") as f:
-                json.dump(serializable_results, f, ensure_ascii=False, indent=2)
+            results_file.write_bytes(
+                orjson.dumps(
+                    serializable_results,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+                )
+            )
         except Exception as e:
             logger.error(f"フェーズ結果の保存に失敗: {e}")
             raise
@@ -3,6 +3,7 @@ Research Engine - 調査実行エンジン
 """
 import json
 import logging
+import re
 import time
 from pathlib import Path
 from datetime import datetime
@@ -13,6 +14,9 @@ from src.engine.web_search import WebSearchInterface
 # ロギング設定
 logger = logging.getLogger(__name__)
 
+# 調査結果中のURL（引用 [n] の後ろに続くURLもこれで拾える）
+_URL_RE = re.compile(r"https?://[^\s\)]+")
+
 
 class WebSearchProtocol(Protocol):
     """Web Search のプロトコル定義"""
@@ -312,8 +316,8 @@ Web検索を活用して最新の情報を収集し、深い分析を行って
                     query = " ".join(words[:3])  # 最初の3単語を使用
                     queries.append(query)
 
-        # 重複を除去
-        unique_queries = list(set(queries))
+        # 出現順を保ったまま重複を除去
+        unique_queries = list(dict.fromkeys(queries))
 
         logger.info(f"抽出された検索クエリ: {unique_queries[:3]}...")
         return unique_queries
@@ -337,22 +341,11 @@ Web検索を活用して最新の情報を収集し、深い分析を行って
 
     def extract_sources(self, research_result: str) -> List[str]:
         """調査結果から情報源を抽出"""
-        sources = []
-
-        # URLパターンを検索
-        import re
-
-        url_pattern = r"https?://[^\s\)]+"
-        urls = re.findall(url_pattern, research_result)
-        sources.extend(urls)
-
-        # 引用パターンを検索
-        citation_pattern = r"\[(\d+)\].*?(https?://[^\s\)]+)"
-        citations = re.findall(citation_pattern, research_result)
-        sources.extend([citation[1] for citation in citations])
+        # URLパターンを検索（引用 [n] のURLも同じ走査で含まれる）
+        sources = _URL_RE.findall(research_result)
 
-        # 重複を除去
-        unique_sources = list(set(sources))
+        # 出現順を保ったまま重複を除去
+        unique_sources = list(dict.fromkeys(sources))
 
         logger.info(f"抽出された情報源: {len(unique_sources)}件")
         return unique_sources
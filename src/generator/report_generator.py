@@ -4,6 +4,7 @@ Report Generator - レポート生成
 import logging
 from pathlib import Path
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any, List, Optional, Protocol
 from dataclasses import dataclass
 
@@ -14,6 +15,21 @@ from dataclasses import dataclass
 # ロギング設定
 logger = logging.getLogger(__name__)
 
+# フェーズ名と日本語表記の対応
+PHASE_NAMES_JP = MappingProxyType(
+    {
+        "phase_1": "フェーズI: 内部環境分析と事業モデル評価",
+        "phase_2": "フェーズII: 外部環境分析と事業機会の特定",
+        "phase_3": "フェーズIII: ターゲット顧客とインサイトの解明",
+        "phase_4": "フェーズIV: 提供価値と市場投入(GTM)戦略",
+        "phase_5": "フェーズV: グロース戦略と収益性分析",
+        "phase_6": "フェーズVI: マーケティング・コミュニケーション戦略",
+        "phase_7": "フェーズVII: 戦略実行を支える組織と基盤",
+        "phase_8": "フェーズVIII: 持続可能性とリスクマネジメント",
+        "final_phase": "最終フェーズ: 全体戦略の統合と提言",
+    }
+)
+
 
 @dataclass
 class GeneratorConfig:
@@ -67,8 +83,7 @@ class ReportGenerator:
                 self._create_backup(report_path)
 
             # ファイルに保存
-            with open(report_path, "w", encoding="utf-8") as f:
-                f.write(report_content)
+            report_path.write_text(report_content, encoding="utf-8")
 
             logger.info(f"    📄 レポート生成: {report_path}")
             return report_path
@@ -338,35 +353,23 @@ class ReportGenerator:
                 if "sources" in result and result["sources"]:
                     references.extend(result["sources"])
 
-            # 重複を除去
-            unique_references = list(set(references))
+            # 出現順を保ったまま重複を除去
+            unique_references = list(dict.fromkeys(references))
 
             if not unique_references:
                 return "参考文献がありません。"
 
-            references_text = ""
-            for i, ref in enumerate(unique_references[:15], 1):  # 最大15件
-                references_text += f"{i}. {ref}\n"
-
-            return references_text
+            # 最大15件
+            return "".join(
+                f"{i}. {ref}\n" for i, ref in enumerate(unique_references[:15], 1)
+            )
         except Exception as e:
             logger.error(f"参考文献セクション作成中にエラーが発生: {e}")
             return "参考文献の生成中にエラーが発生しました。"
 
     def get_phase_name_jp(self, phase_name: str) -> str:
         """フェーズ名を日本語に変換"""
-        phase_mapping = {
-            "phase_1": "フェーズI: 内部環境分析と事業モデル評価",
-            "phase_2": "フェーズII: 外部環境分析と事業機会の特定",
-            "phase_3": "フェーズIII: ターゲット顧客とインサイトの解明",
-            "phase_4": "フェーズIV: 提供価値と市場投入(GTM)戦略",
-            "phase_5": "フェーズV: グロース戦略と収益性分析",
-            "phase_6": "フェーズVI: マーケティング・コミュニケーション戦略",
-            "phase_7": "フェーズVII: 戦略実行を支える組織と基盤",
-            "phase_8": "フェーズVIII: 持続可能性とリスクマネジメント",
-            "final_phase": "最終フェーズ: 全体戦略の統合と提言",
-        }
-        return phase_mapping.get(phase_name, phase_name)
+        return PHASE_NAMES_JP.get(phase_name, phase_name)
 
     def generate_summary_report(
         self, config_data: Dict[str, Any], all_results: Dict[str, Any]
@@ -388,8 +391,7 @@ class ReportGenerator:
             summary_content = self._create_summary_content(config_data, all_results)
 
             # ファイルに保存
-            with open(summary_path, "w", encoding="utf-8") as f:
-                f.write(summary_content)
+            summary_path.write_text(summary_content, encoding="utf-8")
 
             logger.info(f"✅ 全体サマリーレポートを生成しました: {summary_path}")
         except Exception as e:
@@ -1,14 +1,20 @@
 """
 Business Strategy Research System - Main Entry Point
 """
+import os
 import sys
 import argparse
 import logging
-import json
+import orjson
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, List, Tuple, Optional
-from src.controller.research_controller import ResearchController
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Tuple, Optional
 from src.utils.config_reader import ConfigReader
+from src.generator.report_generator import PHASE_NAMES_JP
+from src.utils.validators import QualityChecker
+
+if TYPE_CHECKING:
+    from src.controller.research_controller import ResearchController
 
 # ロギング設定
 logging.basicConfig(
@@ -18,18 +24,61 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# プロジェクトルート（インスタンス生成ごとのresolveを避けるため一度だけ解決）
+_ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# フェーズ選択メニューの番号とフェーズ名の対応
+_PHASE_CHOICES = {str(i): f"phase_{i}" for i in range(1, 9)}
+_PHASE_CHOICES["9"] = "final_phase"
+
+# テーマ選択メニューのグループ
+_THEME_GROUPS = (
+    ("内部環境分析", ("A", "B")),
+    ("外部環境分析", ("1", "2", "3", "4")),
+    ("顧客分析", ("5", "6", "7")),
+    ("GTM戦略", ("8", "9", "10", "11", "12")),
+    ("グロース戦略", ("13", "14", "15")),
+    (
+        "マーケティング戦略",
+        ("16", "17", "18", "19", "20", "21", "22", "23", "24", "25", "26"),
+    ),
+    ("組織基盤", ("27", "28", "29", "30", "31", "32")),
+    ("リスク管理", ("33", "34", "35")),
+    ("統合戦略", ("Z",)),
+)
+
+
+def _iter_reports(output_dir: Path) -> Iterator[Path]:
+    """出力ディレクトリ内の各フェーズのテーマ別レポートのパスを列挙"""
+    for phase_name in PHASE_NAMES_JP:
+        try:
+            with os.scandir(output_dir / phase_name) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        yield Path(entry.path)
+        except FileNotFoundError:
+            continue
+
 
 class BSRSMain:
     def __init__(self) -> None:
-        self.root_dir = Path(__file__).parent.parent.resolve()
+        self.root_dir = _ROOT_DIR
         self.config_reader = ConfigReader()
-        self.controller = ResearchController()
+        self.quality_checker = QualityChecker()
+        self.controller: Optional["ResearchController"] = None
+        self._prompts_data: Optional[Dict[str, Any]] = None
+        self._theme_index: Dict[str, Tuple[str, Dict[str, Any]]] = {}
 
-    def interactive_mode(self) -> None:
-        """対話モードの実行"""
-        logger.info("\n--- Business Strategy Research System ---\n")
+    def _controller(self) -> "ResearchController":
+        """ResearchControllerを初回使用時に生成"""
+        if self.controller is None:
+            from src.controller.research_controller import ResearchController
 
-        # 設定ファイルの確認
+            self.controller = ResearchController()
+        return self.controller
+
+    def load_project_config(self) -> Optional[Dict[str, Any]]:
+        """プロジェクト設定ファイルの検索と読み込み"""
         config_file = self.config_reader.find_config_file()
         if not config_file:
             logger.error("❌ 設定ファイルが見つかりません。")
@@ -38,13 +87,22 @@ class BSRSMain:
             logger.info("2. project_config.md として保存")
             logger.info("3. 必要事項を記入")
             logger.info("4. 再度このスクリプトを実行")
-            return
+            return None
 
         logger.info(f"✅ 設定ファイルを読み込みました: {config_file}")
         try:
-            config_data = self.config_reader.load_config(config_file)
+            return self.config_reader.load_config(config_file)
         except Exception as e:
             logger.error(f"❌ 設定ファイルの読み込みに失敗しました: {e}")
+            return None
+
+    def interactive_mode(self) -> None:
+        """対話モードの実行"""
+        logger.info("\n--- Business Strategy Research System ---\n")
+
+        # 設定ファイルの確認
+        config_data = self.load_project_config()
+        if config_data is None:
             return
 
         # 設定内容の確認
@@ -68,7 +126,7 @@ class BSRSMain:
         choice = input("\n選択 (1-4): ")
 
         if choice == "1":
-            self.controller.run_full_research(config_data)
+            self._controller().run_full_research(config_data)
         elif choice == "2":
             self.select_phase_mode(config_data)
         elif choice == "3":
@@ -81,60 +139,48 @@ class BSRSMain:
     def select_phase_mode(self, config_data: Dict[str, Any]) -> None:
         """フェーズ選択モード"""
         logger.info("\n実行するフェーズを選択してください:")
-        phases = [
-            "1. フェーズI: 内部環境分析と事業モデル評価",
-            "2. フェーズII: 外部環境分析と事業機会の特定",
-            "3. フェーズIII: ターゲット顧客とインサイトの解明",
-            "4. フェーズIV: 提供価値と市場投入(GTM)戦略",
-            "5. フェーズV: グロース戦略と収益性分析",
-            "6. フェーズVI: マーケティング・コミュニケーション戦略",
-            "7. フェーズVII: 戦略実行を支える組織と基盤",
-            "8. フェーズVIII: 持続可能性とリスクマネジメント",
-            "9. 最終フェーズ: 全体戦略の統合と提言",
-        ]
-        for phase in phases:
-            logger.info(phase)
+        for choice, phase_name in _PHASE_CHOICES.items():
+            logger.info("%s. %s", choice, PHASE_NAMES_JP[phase_name])
 
         choice = input("\n選択 (1-9): ")
-        phase_map = {str(i): f"phase_{i}" for i in range(1, 9)}
-        phase_map["9"] = "final_phase"
 
-        if choice in phase_map:
-            self.controller.run_phase_research(config_data, phase_map[choice])
+        if choice in _PHASE_CHOICES:
+            self._controller().run_phase_research(config_data, _PHASE_CHOICES[choice])
         else:
             logger.error("❌ 無効な選択です。")
 
-    def select_theme_mode(self, config_data: Dict[str, Any]) -> None:
-        """全36テーマから選択可能にする"""
-        logger.info("\n実行するテーマを選択してください:")
+    @cached_property
+    def _theme_menu(self) -> Tuple[List[Tuple[str, Dict[str, Any]]], List[str]]:
+        """テーマ選択肢とメニュー表示行を初回のみ構築"""
+        all_themes: List[Tuple[str, Dict[str, Any]]] = []
+        lines: List[str] = []
 
         # テーマをグループ化して表示
-        theme_groups = [
-            ("内部環境分析", ["A", "B"]),
-            ("外部環境分析", ["1", "2", "3", "4"]),
-            ("顧客分析", ["5", "6", "7"]),
-            ("GTM戦略", ["8", "9", "10", "11", "12"]),
-            ("グロース戦略", ["13", "14", "15"]),
-            (
-                "マーケティング戦略",
-                ["16", "17", "18", "19", "20", "21", "22", "23", "24", "25", "26"],
-            ),
-            ("組織基盤", ["27", "28", "29", "30", "31", "32"]),
-            ("リスク管理", ["33", "34", "35"]),
-            ("統合戦略", ["Z"]),
-        ]
-
-        all_themes: List[Tuple[str, Dict[str, Any]]] = []
-        for group_name, theme_ids in theme_groups:
-            logger.info(f"\n【{group_name}】")
+        for group_name, theme_ids in _THEME_GROUPS:
+            lines.append(f"\n【{group_name}】")
             for theme_id in theme_ids:
                 theme_info = self.get_theme_info(theme_id)
                 if theme_info:
-                    idx = len(all_themes) + 1
                     all_themes.append((theme_id, theme_info))
-                    logger.info(f"{idx:2d}. [{theme_id:>3}] {theme_info['name']}")
+                    lines.append(
+                        f"{len(all_themes):2d}. [{theme_id:>3}] {theme_info['name']}"
+                    )
                 else:
-                    logger.info(f"    [{theme_id:>3}] (データ未定義)")
+                    lines.append(f"    [{theme_id:>3}] (データ未定義)")
+
+        return all_themes, lines
+
+    def list_themes(self) -> None:
+        """テーマ一覧の表示"""
+        for line in self._theme_menu[1]:
+            logger.info(line)
+
+    def select_theme_mode(self, config_data: Dict[str, Any]) -> None:
+        """全36テーマから選択可能にする"""
+        logger.info("\n実行するテーマを選択してください:")
+
+        all_themes = self._theme_menu[0]
+        self.list_themes()
 
         if not all_themes:
             logger.error("\n❌ 利用可能なテーマがありません")
@@ -147,113 +193,120 @@ class BSRSMain:
             if 0 <= idx < len(all_themes):
                 theme_id, theme_info = all_themes[idx]
                 phase_name = self.get_phase_for_theme(theme_id)
-                self.controller.run_single_theme(config_data, phase_name, theme_id)
+                self._controller().run_single_theme(config_data, phase_name, theme_id)
             else:
                 logger.error("❌ 無効な選択です。")
         except ValueError:
             logger.error("❌ 数字を入力してください。")
 
+    def _load_prompts_data(self) -> Dict[str, Any]:
+        """prompts_data.jsonを初回のみ読み込み、テーマ索引とともにキャッシュする"""
+        if self._prompts_data is None:
+            try:
+                prompts_data_path = self.root_dir / "prompts_data.json"
+                self._prompts_data = orjson.loads(prompts_data_path.read_bytes())
+            except (FileNotFoundError, orjson.JSONDecodeError) as e:
+                logger.debug(f"テーマ情報の取得に失敗: {e}")
+                self._prompts_data = {}
+
+            # テーマIDからフェーズとテーマ情報を直接引けるようにする
+            self._theme_index = {
+                theme_id: (phase_name, theme_info)
+                for phase_name, phase_data in self._prompts_data.items()
+                for theme_id, theme_info in phase_data.items()
+            }
+
+            # prompts_data.jsonが無い場合は同梱のphase_config.jsonから索引を作る
+            if not self._theme_index:
+                self._theme_index = {
+                    theme["theme_id"]: (theme["phase"], theme["info"])
+                    for theme in self.config_reader.get_all_themes().values()
+                }
+        return self._prompts_data
+
     def get_theme_info(self, theme_id: str) -> Optional[Dict[str, Any]]:
         """テーマIDからテーマ情報を取得"""
-        try:
-            prompts_data_path = self.root_dir / "prompts_data.json"
-            with open(prompts_data_path, "r", encoding="utf-8") as f:
-                prompts_data = json.load(f)
-
-            # 全フェーズから該当テーマを検索
-            for phase_name, phase_data in prompts_data.items():
-                if theme_id in phase_data:
-                    return phase_data[theme_id]
-        except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
-            logger.debug(f"テーマ情報の取得に失敗: {e}")
-
-        return None
+        self._load_prompts_data()
+        return self._theme_index.get(theme_id, (None, None))[1]
 
     def get_phase_for_theme(self, theme_id: str) -> str:
         """テーマIDからフェーズ名を取得"""
-        phase_mapping = {
-            "A": "phase_1",
-            "B": "phase_1",
-            "1": "phase_2",
-            "2": "phase_2",
-            "3": "phase_2",
-            "4": "phase_2",
-            "5": "phase_3",
-            "6": "phase_3",
-            "7": "phase_3",
-            "8": "phase_4",
-            "9": "phase_4",
-            "10": "phase_4",
-            "11": "phase_4",
-            "12": "phase_4",
-            "13": "phase_5",
-            "14": "phase_5",
-            "15": "phase_5",
-            "16": "phase_6",
-            "17": "phase_6",
-            "18": "phase_6",
-            "19": "phase_6",
-            "20": "phase_6",
-            "21": "phase_6",
-            "22": "phase_6",
-            "23": "phase_6",
-            "24": "phase_6",
-            "25": "phase_6",
-            "26": "phase_6",
-            "27": "phase_7",
-            "28": "phase_7",
-            "29": "phase_7",
-            "30": "phase_7",
-            "31": "phase_7",
-            "32": "phase_7",
-            "33": "phase_8",
-            "34": "phase_8",
-            "35": "phase_8",
-            "Z": "final_phase",
-        }
-        return phase_mapping.get(theme_id, "phase_1")
+        self._load_prompts_data()
+        return self._theme_index.get(theme_id, (None,))[0] or "phase_1"
 
     def quality_check_mode(self, config_data: Dict[str, Any]) -> None:
         """品質チェックモード"""
         logger.info("\n品質チェックを実行します...")
 
-        from src.utils.validators import QualityChecker
-
-        quality_checker = QualityChecker()
         output_dir = self.root_dir / "outputs" / config_data["project_name"]
 
         if not output_dir.exists():
             logger.error("❌ まだレポートが生成されていません。")
             return
 
-        # すべてのレポートをチェック
-        all_reports = list(output_dir.rglob("*.md"))
+        # すべてのテーマ別レポートをチェック（全体サマリーは出力直下のため対象外）
+        report_paths = list(_iter_reports(output_dir))
         issues_found = False
+        check_failed = False
 
-        for report_path in all_reports:
-            if "00_全体戦略サマリー" not in str(report_path):
-                try:
-                    result = quality_checker.check_report(report_path)
-                    if not result["passed"]:
-                        issues_found = True
-                        logger.warning(f"\n⚠️  {report_path.name}")
-                        for issue in result["issues"]:
-                            logger.warning(f"   - {issue}")
-                except Exception as e:
-                    logger.error(f"レポートチェック中にエラーが発生: {e}")
-
-        if not issues_found:
-            logger.info("\n✅ すべてのレポートが品質基準を満たしています。")
-        else:
+        try:
+            for report_path, result in zip(
+                report_paths, self.quality_checker.check_reports(report_paths)
+            ):
+                if not result["passed"]:
+                    issues_found = True
+                    logger.warning(f"\n⚠️  {report_path.name}")
+                    for issue in result["issues"]:
+                        logger.warning(f"   - {issue}")
+        except Exception as e:
+            # チェックできなかったレポートを合格扱いにしない
+            check_failed = True
+            logger.error(f"レポートチェック中にエラーが発生: {e}")
+            logger.error("❌ 品質チェックを完了できなかったレポートがあります。")
+
+        if issues_found:
             logger.warning("\n品質改善が必要なレポートがあります。")
             retry = input("再実行しますか？ (y/n): ")
             if retry.lower() == "y":
                 # TODO: 品質基準を満たさないレポートのみ再実行
                 logger.info("再実行機能は開発中です。")
+        elif not check_failed:
+            logger.info("\n✅ すべてのレポートが品質基準を満たしています。")
+
+    def theme_mode(self, theme_id: str) -> bool:
+        """メニューを表示せずに指定テーマを実行（実行できなかった場合はFalse）"""
+        self._load_prompts_data()
+        if theme_id not in self._theme_index:
+            logger.error(f"❌ テーマ {theme_id} が見つかりません。")
+            return False
+
+        config_data = self.load_project_config()
+        if config_data is None:
+            return False
 
-    def run(self) -> None:
+        phase_name = self._theme_index[theme_id][0]
+        self._controller().run_single_theme(config_data, phase_name, theme_id)
+        return True
+
+    def run(self, argv: Optional[List[str]] = None) -> None:
         """メイン実行"""
-        self.interactive_mode()
+        parser = argparse.ArgumentParser(description="Business Strategy Research System")
+        parser.add_argument(
+            "--theme", help="対話メニューを使わずに実行するテーマID（例: A, 1, Z）"
+        )
+        parser.add_argument(
+            "--list-themes", action="store_true", help="テーマ一覧を表示して終了"
+        )
+        args = parser.parse_args(argv)
+
+        if args.list_themes:
+            self.list_themes()
+        elif args.theme:
+            # スクリプトから呼び出した場合に失敗を検知できるよう終了コードで返す
+            if not self.theme_mode(args.theme):
+                sys.exit(1)
+        else:
+            self.interactive_mode()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+"""
+Config Models - 設定バリデーション用モデル
+"""
+from typing import Dict, List
+from pydantic import BaseModel, Field, RootModel
+
+
+# フェーズ設定のバリデーション用Pydanticモデル
+class ThemeConfig(BaseModel):
+    name: str = Field(..., description="テーマ名")
+    main_question: str = Field(..., description="主要な質問")
+
+
+class PhaseConfig(BaseModel):
+    name: str = Field(..., description="フェーズ名")
+    themes: Dict[str, ThemeConfig] = Field(..., description="テーマ設定")
+
+
+class PhaseConfigFile(RootModel[Dict[str, PhaseConfig]]):
+    """phase_1〜phase_8, final_phase などフェーズ名をキーとする設定全体"""
+
+
+# システム設定のバリデーション用Pydanticモデル
+class SystemConfig(BaseModel):
+    project_name: str = Field(..., description="プロジェクト名")
+    company_name: str = Field(..., description="企業名")
+    industry: str = Field(..., description="業界")
+    product_service: str = Field(..., description="製品・サービス")
+    target_market: str = Field(..., description="対象市場")
+    region: str = Field(..., description="地域")
+    competitors: List[str] = Field(default_factory=list, description="競合企業")
+    target_customer: str = Field(..., description="ターゲット顧客")
+    persona: str = Field(..., description="顧客ペルソナ")
+    new_product_idea: str = Field(..., description="新製品アイデア")
+    target_user: str = Field(..., description="ターゲットユーザー")
+    candidate_countries: str = Field(..., description="候補国")
+    brand_name: str = Field(..., description="ブランド名")
+    division: str = Field(..., description="事業部")
+    main_goal: str = Field(..., description="主要目標")
+    budget: str = Field(..., description="予算")
+    campaign_objective: str = Field(..., description="キャンペーン目的")
+    theme: str = Field(..., description="テーマ")
+    objective: str = Field(..., description="目的")
+    enable_web_search: bool = Field(default=True, description="Web検索有効化")
@@ -1,16 +1,55 @@
 """
 Config Reader - 設定ファイル読み込み
 """
+import os
 import re
-import json
+import shutil
 import logging
+import functools
+import orjson
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Protocol
-from pydantic import BaseModel, Field, ValidationError
+from typing import TYPE_CHECKING, Dict, Any, Optional, Protocol, Tuple, Type
+from dataclasses import dataclass
+
+if TYPE_CHECKING:
+    # pydanticはJSON設定の読み込み時にのみ遅延インポートする
+    from pydantic import BaseModel
 
 # ロギング設定
 logger = logging.getLogger(__name__)
 
+# project_config.md の項目名と設定キーの対応
+CONFIG_FIELDS = {
+    "プロジェクト名": "project_name",
+    "自社名": "company_name",
+    "業界": "industry",
+    "事業部門": "division",
+    "主要製品/サービス": "product_service",
+    "ブランド名": "brand_name",
+    "新機能や新製品のアイデア": "new_product_idea",
+    "想定するターゲットユーザー": "target_user",
+    "対象市場": "target_market",
+    "国・地域": "region",
+    "競合企業": "competitors",
+    "ターゲット顧客": "target_customer",
+    "分析対象とする主要な顧客ペルソナ": "persona",
+    "計測可能な最重要目標": "main_goal",
+    "キャンペーン目的": "campaign_objective",
+    "調査の目的": "objective",
+    "テーマ": "theme",
+    "総予算額": "budget",
+    "候補国": "candidate_countries",
+}
+
+# validate_config_data で空であってはならない項目
+REQUIRED_FIELDS = (
+    "project_name",
+    "company_name",
+    "industry",
+    "product_service",
+    "target_market",
+)
+
 
 class ConfigValidatorProtocol(Protocol):
     """設定バリデーターのプロトコル定義"""
@@ -29,51 +68,37 @@ class ConfigReaderConfig:
     strict_validation: bool = True
 
 
-# フェーズ設定のバリデーション用Pydanticモデル
-class ThemeConfig(BaseModel):
-    name: str = Field(..., description="テーマ名")
-    main_question: str = Field(..., description="主要な質問")
-
-
-class PhaseConfig(BaseModel):
-    name: str = Field(..., description="フェーズ名")
-    themes: Dict[str, ThemeConfig] = Field(..., description="テーマ設定")
-
-
-class PhaseConfigFile(BaseModel):
-    phase_1: PhaseConfig = Field(..., description="フェーズ1設定")
-    phase_2: PhaseConfig = Field(..., description="フェーズ2設定")
-    phase_3: PhaseConfig = Field(..., description="フェーズ3設定")
-    phase_4: PhaseConfig = Field(..., description="フェーズ4設定")
-    phase_5: PhaseConfig = Field(..., description="フェーズ5設定")
-    phase_6: PhaseConfig = Field(..., description="フェーズ6設定")
-    phase_7: PhaseConfig = Field(..., description="フェーズ7設定")
-    phase_8: PhaseConfig = Field(..., description="フェーズ8設定")
-    final_phase: PhaseConfig = Field(..., description="最終フェーズ設定")
-
-
-# システム設定のバリデーション用Pydanticモデル
-class SystemConfig(BaseModel):
-    project_name: str = Field(..., description="プロジェクト名")
-    company_name: str = Field(..., description="企業名")
-    industry: str = Field(..., description="業界")
-    product_service: str = Field(..., description="製品・サービス")
-    target_market: str = Field(..., description="対象市場")
-    region: str = Field(..., description="地域")
-    competitors: List[str] = Field(default_factory=list, description="競合企業")
-    target_customer: str = Field(..., description="ターゲット顧客")
-    persona: str = Field(..., description="顧客ペルソナ")
-    new_product_idea: str = Field(..., description="新製品アイデア")
-    target_user: str = Field(..., description="ターゲットユーザー")
-    candidate_countries: str = Field(..., description="候補国")
-    brand_name: str = Field(..., description="ブランド名")
-    division: str = Field(..., description="事業部")
-    main_goal: str = Field(..., description="主要目標")
-    budget: str = Field(..., description="予算")
-    campaign_objective: str = Field(..., description="キャンペーン目的")
-    theme: str = Field(..., description="テーマ")
-    objective: str = Field(..., description="目的")
-    enable_web_search: bool = Field(default=True, description="Web検索有効化")
+# 設定項目行（- 項目名: 値）の抽出パターン
+# （値が空の項目が次の行を値として取り込まないよう、空白に改行を含めない）
+FIELD_LINE_PATTERN = re.compile(
+    r"^-[^\S\n]*([^:：\n]+?)[^\S\n]*[：:][^\S\n]*(.*)$", re.MULTILINE
+)
+
+
+def extract_values(content: str) -> Dict[str, str]:
+    """設定ファイルの全項目を1回の走査で抽出"""
+    values: Dict[str, str] = {}
+    for match in FIELD_LINE_PATTERN.finditer(content):
+        key = CONFIG_FIELDS.get(match.group(1))
+        # 同じ項目が複数ある場合は最初の記載を優先
+        if key and key not in values:
+            values[key] = match.group(2).strip().strip("[]").strip()
+
+    return {key: values.get(key, "") for key in CONFIG_FIELDS.values()}
+
+
+@functools.lru_cache(maxsize=8)
+def _load_project_config(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """プロジェクト設定の解析結果を(パス, 更新時刻)単位でキャッシュ"""
+    content = Path(path_str).read_bytes().decode("utf-8")
+    config_data: Dict[str, Any] = extract_values(content)
+    config_data["competitors"] = [
+        competitor.strip().strip("[]")
+        for competitor in config_data["competitors"].split(",")
+        if competitor.strip()
+    ]
+    config_data["enable_web_search"] = True
+    return config_data
 
 
 class ConfigReader:
@@ -87,26 +112,92 @@ class ConfigReader:
         self.validator = validator
         self.config = config or ConfigReaderConfig()
         self.config_dir = self.root_dir / "config"
+        self.system_config_path = self.config_dir / "system_config.json"
+        self.phase_config_path = self.config_dir / "phase_config.json"
+        self.config_patterns = ["project_config.md", "*_config.md"]
+        # JSON設定のキャッシュ: パス -> (st_mtime_ns, st_size, 検証済みのJSONバイト列)
+        self._cache: Dict[Path, Tuple[int, int, bytes]] = {}
+
+    def find_config_file(self) -> Optional[Path]:
+        """プロジェクト設定ファイルの検索"""
+        for pattern in self.config_patterns:
+            # ワイルドカードを含まないパターンはglobせず存在確認のみ
+            if "*" not in pattern:
+                path = self.root_dir / pattern
+                if path.exists():
+                    return path
+                continue
+
+            match = next(self.root_dir.glob(pattern), None)
+            if match:
+                return match
+        return None
+
+    def clear_cache(self) -> None:
+        """設定ファイルのキャッシュを破棄"""
+        _load_project_config.cache_clear()
+        self._cache.clear()
+
+    def _load_cached(
+        self, config_path: Path, model: Type["BaseModel"]
+    ) -> Dict[str, Any]:
+        """JSON設定の読み込み（更新時刻・サイズが変わらない限り再読み込み・再検証しない）"""
+        stat = config_path.stat()
+        cached = self._cache.get(config_path)
+        # 呼び出し側での変更がキャッシュに波及しないよう、毎回バイト列から新しい辞書を作る
+        # （deepcopyよりorjsonでの再パースの方が速い）
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            return orjson.loads(cached[2])
+
+        raw = config_path.read_bytes()
+        config_data = orjson.loads(raw)
+
+        # Pydanticによるバリデーション（検証のみ行い、読み込んだ辞書をそのまま返す）
+        if self.config.strict_validation:
+            model.model_validate(config_data)
+
+        self._cache[config_path] = (stat.st_mtime_ns, stat.st_size, raw)
+        return config_data
+
+    def load_config(self, config_file: Path) -> Dict[str, Any]:
+        """プロジェクト設定ファイル（Markdown）の読み込み"""
+        try:
+            config_file = Path(config_file)
+            cached = _load_project_config(
+                str(config_file), config_file.stat().st_mtime_ns
+            )
+            # 呼び出し側での変更がキャッシュに波及しないようコピーを返す
+            config_data = {**cached, "competitors": list(cached["competitors"])}
+
+            logger.info(f"プロジェクト設定を読み込みました: {config_data['project_name']}")
+            return config_data
+        except FileNotFoundError as e:
+            logger.error(f"プロジェクト設定ファイルが見つかりません: {config_file}")
+            raise
+        except Exception as e:
+            logger.error(f"プロジェクト設定の読み込みに失敗: {e}")
+            raise
 
     def load_system_config(self) -> Dict[str, Any]:
         """システム設定ファイルの読み込み"""
-        config_path = self.config_dir / "system_config.json"
+        from pydantic import ValidationError
+        from src.utils.config_models import SystemConfig
 
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+        config_path = self.system_config_path
 
-            # Pydanticによるバリデーション
-            if self.config.strict_validation:
-                validated_config = SystemConfig(**config_data)
-                config_data = validated_config.model_dump()
+        try:
+            config_data = self._load_cached(config_path, SystemConfig)
 
             logger.info(f"システム設定を読み込みました: {config_data['project_name']}")
             return config_data
         except FileNotFoundError as e:
             logger.error(f"システム設定ファイルが見つかりません: {config_path}")
             raise
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"システム設定ファイルのJSON形式が不正: {e}")
             raise
         except ValidationError as e:
@@ -118,23 +209,20 @@ class ConfigReader:
 
     def load_phase_config(self) -> Dict[str, Any]:
         """フェーズ設定ファイルの読み込み"""
-        config_path = self.config_dir / "phase_config.json"
+        from pydantic import ValidationError
+        from src.utils.config_models import PhaseConfigFile
 
-        try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config_data = json.load(f)
+        config_path = self.phase_config_path
 
-            # Pydanticによるバリデーション
-            if self.config.strict_validation:
-                validated_config = PhaseConfigFile(**config_data)
-                config_data = validated_config.model_dump()
+        try:
+            config_data = self._load_cached(config_path, PhaseConfigFile)
 
             logger.info("フェーズ設定を読み込みました")
             return config_data
         except FileNotFoundError as e:
             logger.error(f"フェーズ設定ファイルが見つかりません: {config_path}")
             raise
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"フェーズ設定ファイルのJSON形式が不正: {e}")
             raise
         except ValidationError as e:
@@ -147,19 +235,10 @@ class ConfigReader:
     def validate_config_data(self, config_data: Dict[str, Any]) -> bool:
         """設定データの検証"""
         try:
-            required_fields = [
-                "project_name",
-                "company_name",
-                "industry",
-                "product_service",
-                "target_market",
+            missing_fields = [
+                field for field in REQUIRED_FIELDS if not config_data.get(field)
             ]
 
-            missing_fields = []
-            for field in required_fields:
-                if not config_data.get(field):
-                    missing_fields.append(field)
-
             if missing_fields:
                 logger.error(f"必須フィールドが不足しています: {missing_fields}")
                 return False
@@ -259,9 +338,9 @@ class ConfigReader:
         """設定ファイルの保存"""
         try:
             if config_type == "system":
-                config_path = self.config_dir / "system_config.json"
+                config_path = self.system_config_path
             elif config_type == "phase":
-                config_path = self.config_dir / "phase_config.json"
+                config_path = self.phase_config_path
             else:
                 logger.error(f"不明な設定タイプ: {config_type}")
                 return False
@@ -269,14 +348,21 @@ class ConfigReader:
             # バックアップの作成
             if config_path.exists():
                 backup_path = config_path.with_suffix(".json.backup")
-                with open(config_path, "r", encoding="utf-8") as src:
-                    with open(backup_path, "w", encoding="utf-8") as dst:
-                        dst.write(src.read())
+                shutil.copyfile(config_path, backup_path)
                 logger.debug(f"バックアップを作成: {backup_path}")
 
-            # 設定の保存
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(config_data, f, ensure_ascii=False, indent=2)
+            # 設定の保存（一時ファイルに書き出してから置き換え、書き込み途中の破損を防ぐ）
+            tmp_path = config_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(
+                orjson.dumps(
+                    config_data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_APPEND_NEWLINE,
+                )
+            )
+            os.replace(tmp_path, config_path)
+            self._cache.pop(config_path, None)
 
             logger.info(f"{config_type}設定を保存しました: {config_path}")
             return True
@@ -288,12 +374,10 @@ class ConfigReader:
         """設定統計情報の取得"""
         try:
             stats = {
-                "system_config_exists": (
-                    self.config_dir / "system_config.json"
-                ).exists(),
-                "phase_config_exists": (self.config_dir / "phase_config.json").exists(),
+                "system_config_exists": self.system_config_path.exists(),
+                "phase_config_exists": self.phase_config_path.exists(),
                 "config_dir": str(self.config_dir),
-                "total_themes": len(self.get_all_themes()),
+                "total_themes": 0,
             }
 
             # システム設定の詳細統計
@@ -305,15 +389,19 @@ class ConfigReader:
                     "enable_web_search", True
                 )
 
-            # フェーズ設定の詳細統計
+            # フェーズ設定の詳細統計（読み込みは1回のみ）
             if stats["phase_config_exists"]:
                 phase_config = self.load_phase_config()
-                stats["total_phases"] = len(phase_config)
-                stats["phases_with_themes"] = sum(
-                    1
+                phases_with_themes = [
+                    phase_data
                     for phase_data in phase_config.values()
                     if isinstance(phase_data, dict) and "themes" in phase_data
+                ]
+                stats["total_themes"] = sum(
+                    len(phase_data["themes"]) for phase_data in phases_with_themes
                 )
+                stats["total_phases"] = len(phase_config)
+                stats["phases_with_themes"] = len(phases_with_themes)
 
             return stats
         except Exception as e:
@@ -1,17 +1,73 @@
 """
 Cursor Integration Helper - Cursor連携ヘルパー
 """
+import os
 import logging
 import re
-import json
+import time
+import orjson
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional, Protocol
 from dataclasses import dataclass
-from datetime import datetime
 
 # ロギング設定
 logger = logging.getLogger(__name__)
 
+# プロンプト・応答の解析に使う正規表現（モジュール読み込み時に一度だけコンパイル）
+_COMPANY_RE = re.compile(r"企業名[：:]\s*([^\n]+)")
+_INDUSTRY_RE = re.compile(r"業界[：:]\s*([^\n]+)")
+_MARKET_RE = re.compile(r"対象市場[：:]\s*([^\n]+)")
+_COMPETITORS_RE = re.compile(r"競合企業[：:]\s*([^\n]+)")
+_HEADING_RE = re.compile(r"^#\s+", re.MULTILINE)
+_URL_RE = re.compile(r"https?://[^\s\)]+")
+# 数値＋単位（共通の接頭辞を持つ「万円」「億円」を「円」より先に試す）
+_NUMBER_RE = re.compile(r"\d+(?:万円|億円|%|円|社|人)")
+# 重要なキーワードを含む行（箇条書きの記号は除く）
+_INSIGHT_RE = re.compile(
+    r"^(?:\s*[-*+]\s+)?(.*(?:重要|結論|推奨|発見|課題|機会|戦略).*)$", re.MULTILINE
+)
+
+# Cursor向け調査プロンプトのテンプレート（Web検索ガイドを含め1回のformatで組み立てる）
+_CURSOR_PROMPT_TMPL = """
+# Cursor AI 調査プロンプト
+
+## 基本情報
+- **企業名**: {company_name}
+- **業界**: {industry}
+- **対象市場**: {target_market}
+- **競合企業**: {competitors}
+
+## 調査指示
+
+{base_prompt}
+
+## Web検索活用ガイド
+
+
+【Web検索の活用方法】
+1. 検索ボタンをクリックしてWeb検索を有効化
+2. 以下のキーワードで検索：
+   - {company_name} {industry} 市場分析 2024
+   - {competitors} 戦略 事例
+   - {target_market} トレンド 統計
+3. 信頼できる情報源を優先（公式サイト、業界レポート、政府統計など）
+
+
+## 出力形式
+- マークダウン形式で出力
+- 見出し、箇条書き、表を適切に使用
+- 情報源を明記（URL、出典名）
+- 具体的な数値データを含める
+
+## 品質要件
+- 最低10個以上の信頼できる情報源を参照
+- 2024年の最新情報を重視
+- 定量的データに基づく分析
+- 実行可能性を考慮した提言
+
+調査完了後、結果全体をコピーして返してください。
+"""
+
 
 class CursorIntegrationProtocol(Protocol):
     """Cursor統合のプロトコル定義"""
@@ -46,53 +102,21 @@ class CursorIntegration:
     ) -> str:
         """Cursor用にプロンプトをフォーマット"""
         try:
-            web_search_instruction = """
-【Web検索の活用方法】
-1. 検索ボタンをクリックしてWeb検索を有効化
-2. 以下のキーワードで検索：
-   - {company_name} {industry} 市場分析 2024
-   - {competitors} 戦略 事例
-   - {target_market} トレンド 統計
-3. 信頼できる情報源を優先（公式サイト、業界レポート、政府統計など）
-""".format(
-                company_name=config_data.get("company_name", ""),
-                industry=config_data.get("industry", ""),
-                competitors=", ".join(config_data.get("competitors", [])),
-                target_market=config_data.get("target_market", ""),
+            company_name = config_data.get("company_name", "")
+            industry = config_data.get("industry", "")
+            target_market = config_data.get("target_market", "")
+            competitors = ", ".join(config_data.get("competitors", []))
+
+            cursor_prompt = _CURSOR_PROMPT_TMPL.format_map(
+                {
+                    "company_name": company_name,
+                    "industry": industry,
+                    "target_market": target_market,
+                    "competitors": competitors,
+                    "base_prompt": base_prompt,
+                }
             )
 
-            cursor_prompt = f"""
-# Cursor AI 調査プロンプト
-
-## 基本情報
-- **企業名**: {config_data.get('company_name', '')}
-- **業界**: {config_data.get('industry', '')}
-- **対象市場**: {config_data.get('target_market', '')}
-- **競合企業**: {', '.join(config_data.get('competitors', []))}
-
-## 調査指示
-
-{base_prompt}
-
-## Web検索活用ガイド
-
-{web_search_instruction}
-
-## 出力形式
-- マークダウン形式で出力
-- 見出し、箇条書き、表を適切に使用
-- 情報源を明記（URL、出典名）
-- 具体的な数値データを含める
-
-## 品質要件
-- 最低10個以上の信頼できる情報源を参照
-- 2024年の最新情報を重視
-- 定量的データに基づく分析
-- 実行可能性を考慮した提言
-
-調査完了後、結果全体をコピーして返してください。
-"""
-
             # プロンプト長のチェック
             if len(cursor_prompt) > self.config.max_prompt_length:
                 logger.warning(f"プロンプトが長すぎます ({len(cursor_prompt)}文字)。要約版を使用します。")
@@ -128,13 +152,9 @@ class CursorIntegration:
             queries = []
 
             # 企業名と業界の組み合わせ
-            company_pattern = r"企業名[：:]\s*([^\n]+)"
-            industry_pattern = r"業界[：:]\s*([^\n]+)"
-            market_pattern = r"対象市場[：:]\s*([^\n]+)"
-
-            company_match = re.search(company_pattern, prompt)
-            industry_match = re.search(industry_pattern, prompt)
-            market_match = re.search(market_pattern, prompt)
+            company_match = _COMPANY_RE.search(prompt)
+            industry_match = _INDUSTRY_RE.search(prompt)
+            market_match = _MARKET_RE.search(prompt)
 
             if company_match and industry_match:
                 company = company_match.group(1).strip()
@@ -148,8 +168,7 @@ class CursorIntegration:
                 queries.append(f"{market} 市場規模 予測")
 
             # 競合企業の検索
-            competitors_pattern = r"競合企業[：:]\s*([^\n]+)"
-            competitors_match = re.search(competitors_pattern, prompt)
+            competitors_match = _COMPETITORS_RE.search(prompt)
             if competitors_match:
                 competitors_text = competitors_match.group(1).strip()
                 competitors = [c.strip() for c in competitors_text.split(",")]
@@ -157,8 +176,8 @@ class CursorIntegration:
                     queries.append(f"{competitor} 戦略 事例")
                     queries.append(f"{competitor} 業績 2024")
 
-            # 重複を除去
-            unique_queries = list(set(queries))
+            # 出現順を保ったまま重複を除去
+            unique_queries = list(dict.fromkeys(queries))
 
             logger.info(f"抽出された検索クエリ: {unique_queries}")
             return unique_queries
@@ -169,11 +188,17 @@ class CursorIntegration:
     def save_cursor_session(self, session_data: Dict[str, Any]) -> Path:
         """Cursorセッションデータの保存"""
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
             session_file = self.temp_dir / f"cursor_session_{timestamp}.json"
 
-            with open(session_file, "w", encoding="utf-8") as f:
-                json.dump(session_data, f, ensure_ascii=False, indent=2)
+            session_file.write_bytes(
+                orjson.dumps(
+                    session_data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_APPEND_NEWLINE,
+                )
+            )
 
             logger.info(f"Cursorセッションを保存しました: {session_file}")
             return session_file
@@ -184,15 +209,14 @@ class CursorIntegration:
     def load_cursor_session(self, session_file: Path) -> Dict[str, Any]:
         """Cursorセッションデータの読み込み"""
         try:
-            with open(session_file, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
+            session_data = orjson.loads(Path(session_file).read_bytes())
 
             logger.info(f"Cursorセッションを読み込みました: {session_file}")
             return session_data
         except FileNotFoundError as e:
             logger.error(f"Cursorセッションファイルが見つかりません: {session_file}")
             raise
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"CursorセッションファイルのJSON形式が不正: {e}")
             raise
         except Exception as e:
@@ -225,8 +249,12 @@ class CursorIntegration:
             }
 
             config_file = self.temp_dir / f"cursor_workspace_{project_name}.json"
-            with open(config_file, "w", encoding="utf-8") as f:
-                json.dump(workspace_config, f, ensure_ascii=False, indent=2)
+            config_file.write_bytes(
+                orjson.dumps(
+                    workspace_config,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+                )
+            )
 
             logger.info(f"Cursorワークスペース設定を作成しました: {config_file}")
             return workspace_config
@@ -252,12 +280,12 @@ class CursorIntegration:
                 validation_result["issues"].append("応答が短すぎます")
 
             # マークダウン形式のチェック
-            if not re.search(r"^#\s+", response, re.MULTILINE):
+            if not _HEADING_RE.search(response):
                 validation_result["score"] -= 10
                 validation_result["warnings"].append("見出しが不足しています")
 
             # 情報源のチェック
-            sources = re.findall(r"https?://[^\s\)]+", response)
+            sources = _URL_RE.findall(response)
             if len(sources) < 5:
                 validation_result["score"] -= 15
                 validation_result["warnings"].append("情報源が不足しています")
@@ -267,7 +295,7 @@ class CursorIntegration:
                 )
 
             # 数値データのチェック
-            numbers = re.findall(r"\d+%|\d+円|\d+万円|\d+億円|\d+社|\d+人", response)
+            numbers = _NUMBER_RE.findall(response)
             if len(numbers) < 3:
                 validation_result["score"] -= 10
                 validation_result["warnings"].append("数値データが不足しています")
@@ -294,31 +322,11 @@ class CursorIntegration:
     def extract_key_insights(self, response: str) -> List[str]:
         """Cursor応答から重要な洞察を抽出"""
         try:
-            insights = []
-
-            # 重要なキーワードを含む行を抽出
-            important_patterns = [
-                r"^.*重要.*$",
-                r"^.*結論.*$",
-                r"^.*推奨.*$",
-                r"^.*発見.*$",
-                r"^.*課題.*$",
-                r"^.*機会.*$",
-                r"^.*戦略.*$",
-            ]
-
-            for pattern in important_patterns:
-                matches = re.findall(pattern, response, re.MULTILINE)
-                insights.extend(matches[:3])  # 各パターンから最大3件
-
-            # 箇条書きから洞察を抽出
-            bullet_points = re.findall(r"^\s*[-*+]\s+(.+)$", response, re.MULTILINE)
-            for point in bullet_points[:5]:  # 最大5件
-                if any(keyword in point for keyword in ["重要", "結論", "推奨", "発見"]):
-                    insights.append(point.strip())
-
-            # 重複を除去
-            unique_insights = list(set(insights))
+            # 重要なキーワードを含む行を一度の走査で抽出
+            insights = (line.strip() for line in _INSIGHT_RE.findall(response))
+
+            # 出現順を保ったまま重複を除去
+            unique_insights = list(dict.fromkeys(insights))
 
             logger.info(f"重要な洞察を {len(unique_insights)} 件抽出しました")
             return unique_insights[:10]  # 最大10件
@@ -329,32 +337,31 @@ class CursorIntegration:
     def create_cursor_summary(self, responses: List[Dict[str, Any]]) -> str:
         """Cursor応答のサマリー作成"""
         try:
-            summary = "# Cursor AI 調査サマリー\n\n"
+            parts: List[str] = ["# Cursor AI 調査サマリー\n\n"]
 
             for i, response_data in enumerate(responses, 1):
-                summary += f"## 調査 {i}\n\n"
-                summary += f"**テーマ**: {response_data.get('theme_id', 'N/A')}\n"
-                summary += f"**ステップ**: {response_data.get('step', 'N/A')}\n"
-                summary += (
+                parts.append(
+                    f"## 調査 {i}\n\n"
+                    f"**テーマ**: {response_data.get('theme_id', 'N/A')}\n"
+                    f"**ステップ**: {response_data.get('step', 'N/A')}\n"
                     f"**実行時間**: {response_data.get('execution_time', 0):.1f}秒\n\n"
                 )
 
                 # 主要な洞察を抽出
                 insights = self.extract_key_insights(response_data.get("result", ""))
                 if insights:
-                    summary += "**主要な洞察**:\n"
-                    for insight in insights[:3]:
-                        summary += f"- {insight}\n"
-                    summary += "\n"
+                    parts.append("**主要な洞察**:\n")
+                    parts.extend(f"- {insight}\n" for insight in insights[:3])
+                    parts.append("\n")
 
                 # 情報源
                 sources = response_data.get("sources", [])
                 if sources:
-                    summary += f"**情報源**: {len(sources)}件\n\n"
+                    parts.append(f"**情報源**: {len(sources)}件\n\n")
 
-                summary += "---\n\n"
+                parts.append("---\n\n")
 
-            return summary
+            return "".join(parts)
         except Exception as e:
             logger.error(f"Cursorサマリー作成中にエラーが発生: {e}")
             return f"サマリー作成中にエラーが発生しました: {e}"
@@ -362,6 +369,16 @@ class CursorIntegration:
     def get_cursor_statistics(self) -> Dict[str, Any]:
         """Cursor統合統計情報の取得"""
         try:
+            # 一時ディレクトリ内のJSONファイル数（リストを作らずに数える）
+            temp_files = 0
+            if self.temp_dir.exists():
+                with os.scandir(self.temp_dir) as entries:
+                    temp_files = sum(
+                        1
+                        for entry in entries
+                        if entry.name.endswith(".json") and entry.is_file()
+                    )
+
             stats = {
                 "config": {
                     "max_prompt_length": self.config.max_prompt_length,
@@ -373,9 +390,7 @@ class CursorIntegration:
                     "root_dir": str(self.root_dir),
                     "temp_dir": str(self.temp_dir),
                 },
-                "temp_files": len(list(self.temp_dir.glob("*.json")))
-                if self.temp_dir.exists()
-                else 0,
+                "temp_files": temp_files,
             }
 
             return stats
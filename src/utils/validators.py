@@ -1,15 +1,39 @@
 """
 Quality Checker - レポート品質チェック
 """
+import os
 import re
 import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Protocol
+from typing import Dict, Any, Iterator, List, Optional, Protocol, Sequence, Tuple
 from dataclasses import dataclass
 
 # ロギング設定
 logger = logging.getLogger(__name__)
 
+# レポート解析に使う正規表現（モジュール読み込み時に一度だけコンパイル）
+_JP_RE = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+")
+_EN_RE = re.compile(r"\b[a-zA-Z]+\b")
+_URL_RE = re.compile(r"https?://[^\s\)]+")
+_CITE_RE = re.compile(r"\[(\d+)\].*?(https?://[^\s\)]+)")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+_BULLET_RE = re.compile(r"^\s*[-*+]\s+", re.MULTILINE)
+_NUMBER_RE = re.compile(r"\d+(?:万円|億円|%|円|社|人)")
+
+# レポートに含まれているべき必須セクション
+REQUIRED_SECTIONS = ("現状分析", "戦略提言", "実行計画", "参考文献")
+
+# 参考文献セクションの見出し
+_REFERENCES_HEADER = "## 参考文献"
+
+# 内容品質チェックで使用状況を数える専門用語
+BUSINESS_TERMS = ("戦略", "分析", "市場", "競合", "顧客", "収益", "コスト", "ROI", "KPI")
+
+# 一括チェックをプロセス並列で実行する最小レポート数
+_PARALLEL_MIN_REPORTS = 4
+
 
 class QualityValidatorProtocol(Protocol):
     """品質バリデーターのプロトコル定義"""
@@ -26,9 +50,40 @@ class QualityConfig:
     min_sources: int = 10
     max_retries: int = 3
     retry_delay: float = 1.0
+    # Falseの場合は構造・内容品質チェック（加減点と警告のみ）を省略する
     strict_validation: bool = True
 
 
+def _term_hits(content: str, threshold: int = 5) -> int:
+    """専門用語の使用数を数える（閾値に達した時点で残りの検索を省略）"""
+    hits = 0
+    for term in BUSINESS_TERMS:
+        if term in content:
+            hits += 1
+            if hits >= threshold:
+                break
+    return hits
+
+
+def _iter_markdown(report_dir: Path) -> Iterator[Tuple[Path, os.stat_result]]:
+    """ディレクトリ以下の .md ファイルを再帰的に列挙（パスとstat結果の組）"""
+    stack = [report_dir]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield Path(entry.path), entry.stat()
+
+
+def _check_one(
+    report_path: Path, config: QualityConfig
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """プロセスプールのワーカーで実行する単一レポートの品質チェック（指標も返す）"""
+    return QualityChecker(config=config)._check(report_path)
+
+
 class QualityChecker:
     def __init__(
         self,
@@ -39,67 +94,127 @@ class QualityChecker:
         self.root_dir = Path(__file__).parent.parent.parent.resolve()
         self.validator = validator
         self.config = config or QualityConfig()
-        self.required_sections = ["現状分析", "戦略提言", "実行計画", "参考文献"]
+        self.required_sections = REQUIRED_SECTIONS
+        # 解析結果のキャッシュ: パス -> (st_mtime_ns, st_size, 指標)
+        self._cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+    def clear_cache(self) -> None:
+        """解析結果のキャッシュを破棄"""
+        self._cache.clear()
+
+    def _cached_metrics(
+        self, key: str, stat: os.stat_result
+    ) -> Optional[Dict[str, Any]]:
+        """更新時刻・サイズが変わっていなければキャッシュ済みの指標を返す"""
+        cached = self._cache.get(key)
+        if (
+            cached is not None
+            and cached[0] == stat.st_mtime_ns
+            and cached[1] == stat.st_size
+        ):
+            return cached[2]
+        return None
 
     def check_report(self, report_path: Path) -> Dict[str, Any]:
         """レポートの品質チェック"""
+        return self._check(report_path)[0]
+
+    def _analyze(self, content: str) -> Dict[str, Any]:
+        """レポート内容の各指標を算出（本文の走査は指標ごとに1回のみ）"""
+        metrics = {
+            "word_count": self._count_words(content),
+            "source_count": self._count_sources(content),
+            "missing_sections": self._check_required_sections(content),
+            "structure_score": 0,
+            "content_score": 0,
+        }
+
+        # 厳密検証しない場合は合否に関わる文字数・情報源・必須セクションのみ算出
+        if not self.config.strict_validation:
+            return metrics
+
+        metrics["structure_score"] = self._check_structure(content)
+        metrics["content_score"] = self._check_content_quality(content)
+        return metrics
+
+    def _check(
+        self, report_path: Path, stat: Optional[os.stat_result] = None
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """品質チェック結果と算出した指標を返す（失敗時の指標はNone）"""
         try:
-            with open(report_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            results = {
-                "passed": True,
-                "score": 100,
-                "issues": [],
-                "warnings": [],
-                "recommendations": [],
-            }
+            report_path = Path(report_path)
+            # 列挙時に取得済みのstat結果があれば再利用
+            if stat is None:
+                stat = report_path.stat()
+            key = str(report_path)
+
+            # 内容が変わっていなければ読み込みと解析を省略
+            # （カスタムバリデーターは本文を必要とするため常に読み込む）
+            content = None
+            metrics = None if self.validator else self._cached_metrics(key, stat)
+            if metrics is None:
+                content = report_path.read_bytes().decode("utf-8")
+                metrics = self._analyze(content)
+                # ファイルサイズも再statせずに済むよう指標と一緒に保持
+                metrics["file_size"] = stat.st_size
+                self._cache[key] = (stat.st_mtime_ns, stat.st_size, metrics)
+
+            # 結果はローカル変数で組み立て、最後に辞書へまとめる
+            passed = True
+            score = 100
+            issues: List[str] = []
+            warnings: List[str] = []
+            recommendations: List[str] = []
+            min_word_count = self.config.min_word_count
+            min_sources = self.config.min_sources
 
             # 文字数チェック
-            word_count = self._count_words(content)
-            if word_count < self.config.min_word_count:
-                results["passed"] = False
-                results["score"] -= 20
-                results["issues"].append(
-                    f"文字数が不足しています ({word_count}/{self.config.min_word_count})"
-                )
+            word_count = metrics["word_count"]
+            if word_count < min_word_count:
+                passed = False
+                score -= 20
+                issues.append(f"文字数が不足しています ({word_count}/{min_word_count})")
             else:
-                results["recommendations"].append(f"文字数は十分です ({word_count}文字)")
+                recommendations.append(f"文字数は十分です ({word_count}文字)")
 
             # 情報源チェック
-            sources_count = self._count_sources(content)
-            if sources_count < self.config.min_sources:
-                results["passed"] = False
-                results["score"] -= 15
-                results["issues"].append(
-                    f"情報源が不足しています ({sources_count}/{self.config.min_sources})"
-                )
+            sources_count = metrics["source_count"]
+            if sources_count < min_sources:
+                passed = False
+                score -= 15
+                issues.append(f"情報源が不足しています ({sources_count}/{min_sources})")
             else:
-                results["recommendations"].append(f"情報源は十分です ({sources_count}件)")
+                recommendations.append(f"情報源は十分です ({sources_count}件)")
 
             # 必須セクションチェック
-            missing_sections = self._check_required_sections(content)
+            missing_sections = metrics["missing_sections"]
             if missing_sections:
-                results["passed"] = False
-                results["score"] -= 10 * len(missing_sections)
-                results["issues"].append(f"必須セクションが不足: {', '.join(missing_sections)}")
+                passed = False
+                score -= 10 * len(missing_sections)
+                issues.append(f"必須セクションが不足: {', '.join(missing_sections)}")
             else:
-                results["recommendations"].append("すべての必須セクションが含まれています")
+                recommendations.append("すべての必須セクションが含まれています")
 
             # 構造チェック
-            structure_score = self._check_structure(content)
-            results["score"] += structure_score
+            structure_score = metrics["structure_score"]
+            score += structure_score
             if structure_score < 0:
-                results["warnings"].append("レポート構造の改善が必要です")
+                warnings.append("レポート構造の改善が必要です")
 
             # 内容品質チェック
-            content_score = self._check_content_quality(content)
-            results["score"] += content_score
+            content_score = metrics["content_score"]
+            score += content_score
             if content_score < 0:
-                results["warnings"].append("内容の品質向上が必要です")
+                warnings.append("内容の品質向上が必要です")
 
-            # スコアの正規化
-            results["score"] = max(0, min(100, results["score"]))
+            results = {
+                "passed": passed,
+                # スコアの正規化
+                "score": max(0, min(100, score)),
+                "issues": issues,
+                "warnings": warnings,
+                "recommendations": recommendations,
+            }
 
             # カスタムバリデーターがある場合は使用
             if self.validator:
@@ -107,7 +222,7 @@ class QualityChecker:
                 results.update(custom_result)
 
             logger.info(f"品質チェック完了: スコア {results['score']}/100")
-            return results
+            return results, metrics
         except FileNotFoundError as e:
             logger.error(f"レポートファイルが見つかりません: {report_path}")
             return {
@@ -116,7 +231,7 @@ class QualityChecker:
                 "issues": [f"ファイルが見つかりません: {e}"],
                 "warnings": [],
                 "recommendations": [],
-            }
+            }, None
         except Exception as e:
             logger.error(f"品質チェック中にエラーが発生: {e}")
             return {
@@ -125,170 +240,131 @@ class QualityChecker:
                 "issues": [f"品質チェックエラー: {e}"],
                 "warnings": [],
                 "recommendations": [],
-            }
+            }, None
 
     def _count_words(self, content: str) -> int:
         """文字数のカウント"""
-        try:
-            # 日本語と英語の単語をカウント
-            japanese_words = len(
-                re.findall(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FAF]+", content)
-            )
-            english_words = len(re.findall(r"\b[a-zA-Z]+\b", content))
-            return japanese_words + english_words
-        except Exception as e:
-            logger.error(f"文字数カウント中にエラーが発生: {e}")
-            return 0
+        # 日本語と英語の単語をカウント
+        japanese_words = len(_JP_RE.findall(content))
+        english_words = len(_EN_RE.findall(content))
+        return japanese_words + english_words
 
     def _count_sources(self, content: str) -> int:
         """情報源のカウント"""
-        try:
-            # URLパターンを検索
-            url_pattern = r"https?://[^\s\)]+"
-            urls = re.findall(url_pattern, content)
-
-            # 引用パターンを検索
-            citation_pattern = r"\[(\d+)\].*?(https?://[^\s\)]+)"
-            citations = re.findall(citation_pattern, content)
-
-            # 参考文献セクションを検索
-            references_section = re.search(r"## 参考文献.*?(?=##|$)", content, re.DOTALL)
-            reference_count = 0
-            if references_section:
-                reference_lines = references_section.group(0).split("\n")
-                reference_count = len(
-                    [
-                        line
-                        for line in reference_lines
-                        if line.strip() and not line.startswith("#")
-                    ]
-                )
-
-            total_sources = len(set(urls)) + len(set(citations)) + reference_count
-            return total_sources
-        except Exception as e:
-            logger.error(f"情報源カウント中にエラーが発生: {e}")
-            return 0
+        # URLパターンを検索
+        urls = _URL_RE.findall(content)
+
+        # 引用パターンを検索
+        citations = _CITE_RE.findall(content)
+
+        # 参考文献セクションを検索（見出しから次の「##」の手前まで）
+        reference_count = 0
+        start = content.find(_REFERENCES_HEADER)
+        if start != -1:
+            end = content.find("##", start + len(_REFERENCES_HEADER))
+            references_section = content[start : end if end != -1 else None]
+            reference_count = sum(
+                1
+                for line in references_section.split("\n")
+                if line.strip() and not line.startswith("#")
+            )
+
+        total_sources = len(set(urls)) + len(set(citations)) + reference_count
+        return total_sources
 
     def _check_required_sections(self, content: str) -> List[str]:
         """必須セクションのチェック"""
-        try:
-            missing_sections = []
-
-            for section in self.required_sections:
-                if section not in content:
-                    missing_sections.append(section)
-
-            return missing_sections
-        except Exception as e:
-            logger.error(f"必須セクションチェック中にエラーが発生: {e}")
-            return self.required_sections
+        return [
+            section for section in self.required_sections if section not in content
+        ]
 
     def _check_structure(self, content: str) -> int:
         """レポート構造のチェック"""
-        try:
-            score = 0
-
-            # 見出しレベルのチェック
-            headings = re.findall(r"^(#{1,6})\s+(.+)$", content, re.MULTILINE)
-            heading_levels = [len(h[0]) for h in headings]
-
-            # 適切な見出し階層があるかチェック
-            if len(set(heading_levels)) >= 3:
-                score += 5
-            else:
-                score -= 5
-
-            # 目次の存在チェック
-            if "## 目次" in content or "## 目次" in content:
-                score += 3
-            else:
-                score -= 3
-
-            # エグゼクティブサマリーの存在チェック
-            if "## エグゼクティブサマリー" in content or "## サマリー" in content:
-                score += 2
-            else:
-                score -= 2
-
-            return score
-        except Exception as e:
-            logger.error(f"構造チェック中にエラーが発生: {e}")
-            return 0
+        score = 0
+
+        # 見出しレベルのチェック（3種類見つかった時点で走査を打ち切る）
+        heading_levels = set()
+        for match in _HEADING_RE.finditer(content):
+            heading_levels.add(len(match.group(1)))
+            if len(heading_levels) >= 3:
+                break
+
+        # 適切な見出し階層があるかチェック
+        if len(heading_levels) >= 3:
+            score += 5
+        else:
+            score -= 5
+
+        # 目次の存在チェック
+        if "## 目次" in content:
+            score += 3
+        else:
+            score -= 3
+
+        # エグゼクティブサマリーの存在チェック
+        if "## エグゼクティブサマリー" in content or "## サマリー" in content:
+            score += 2
+        else:
+            score -= 2
+
+        return score
 
     def _check_content_quality(self, content: str) -> int:
         """内容品質のチェック"""
-        try:
-            score = 0
-
-            # 図表の存在チェック
-            if "|" in content and "---" in content:  # テーブルの存在
-                score += 3
-
-            # 箇条書きの存在チェック
-            bullet_points = len(re.findall(r"^\s*[-*+]\s+", content, re.MULTILINE))
-            if bullet_points >= 10:
-                score += 2
-            elif bullet_points >= 5:
-                score += 1
-            else:
-                score -= 2
-
-            # 数値データの存在チェック
-            numbers = len(re.findall(r"\d+%|\d+円|\d+万円|\d+億円|\d+社|\d+人", content))
-            if numbers >= 5:
-                score += 3
-            elif numbers >= 2:
-                score += 1
-            else:
-                score -= 3
-
-            # 専門用語の使用チェック
-            business_terms = ["戦略", "分析", "市場", "競合", "顧客", "収益", "コスト", "ROI", "KPI"]
-            term_count = sum(1 for term in business_terms if term in content)
-            if term_count >= 5:
-                score += 2
-            elif term_count >= 3:
-                score += 1
-            else:
-                score -= 2
-
-            return score
-        except Exception as e:
-            logger.error(f"内容品質チェック中にエラーが発生: {e}")
-            return 0
+        score = 0
+
+        # 図表の存在チェック
+        if "|" in content and "---" in content:  # テーブルの存在
+            score += 3
+
+        # 箇条書きの存在チェック
+        bullet_points = len(_BULLET_RE.findall(content))
+        if bullet_points >= 10:
+            score += 2
+        elif bullet_points >= 5:
+            score += 1
+        else:
+            score -= 2
+
+        # 数値データの存在チェック
+        numbers = len(_NUMBER_RE.findall(content))
+        if numbers >= 5:
+            score += 3
+        elif numbers >= 2:
+            score += 1
+        else:
+            score -= 3
+
+        # 専門用語の使用チェック
+        term_count = _term_hits(content)
+        if term_count >= 5:
+            score += 2
+        elif term_count >= 3:
+            score += 1
+        else:
+            score -= 2
+
+        return score
 
     def generate_quality_report(self, report_path: Path) -> Dict[str, Any]:
         """詳細な品質レポートの生成"""
         try:
-            quality_result = self.check_report(report_path)
+            # ファイルの読み込みと解析はチェック時の1回のみ
+            quality_result, metrics = self._check(report_path)
 
             report = {
                 "file_path": str(report_path),
-                "file_size": report_path.stat().st_size if report_path.exists() else 0,
+                "file_size": metrics["file_size"] if metrics else 0,
                 "quality_score": quality_result["score"],
                 "passed": quality_result["passed"],
                 "detailed_analysis": {
-                    "word_count": self._count_words(
-                        open(report_path, "r", encoding="utf-8").read()
-                    )
-                    if report_path.exists()
-                    else 0,
-                    "source_count": self._count_sources(
-                        open(report_path, "r", encoding="utf-8").read()
+                    key: metrics[key] if metrics else 0
+                    for key in (
+                        "word_count",
+                        "source_count",
+                        "structure_score",
+                        "content_score",
                     )
-                    if report_path.exists()
-                    else 0,
-                    "structure_score": self._check_structure(
-                        open(report_path, "r", encoding="utf-8").read()
-                    )
-                    if report_path.exists()
-                    else 0,
-                    "content_score": self._check_content_quality(
-                        open(report_path, "r", encoding="utf-8").read()
-                    )
-                    if report_path.exists()
-                    else 0,
                 },
                 "issues": quality_result["issues"],
                 "warnings": quality_result["warnings"],
@@ -345,7 +421,8 @@ class QualityChecker:
                 logger.error(f"レポートディレクトリが見つかりません: {report_dir}")
                 return {"error": f"ディレクトリが見つかりません: {report_dir}"}
 
-            report_files = list(report_dir.glob("**/*.md"))
+            report_entries = list(_iter_markdown(report_dir))
+            report_files = [report_file for report_file, _ in report_entries]
             results = {
                 "total_reports": len(report_files),
                 "passed_reports": 0,
@@ -356,9 +433,11 @@ class QualityChecker:
 
             total_score = 0
 
-            for report_file in report_files:
+            report_stats = [stat for _, stat in report_entries]
+            for report_file, quality_result in zip(
+                report_files, self.check_reports(report_files, report_stats)
+            ):
                 try:
-                    quality_result = self.check_report(report_file)
                     report_info = {
                         "file_path": str(report_file),
                         "quality_score": quality_result["score"],
@@ -397,6 +476,65 @@ class QualityChecker:
             logger.error(f"一括品質チェック中にエラーが発生: {e}")
             return {"error": str(e)}
 
+    def check_reports(
+        self,
+        report_files: Sequence[Path],
+        stats: Optional[Sequence[os.stat_result]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """複数レポートを入力順に品質チェック（件数が多い場合はプロセス並列で実行）"""
+        if stats is None:
+            stats = [None] * len(report_files)
+
+        # カスタムバリデーターは子プロセスへ渡せないため逐次実行
+        if (
+            len(report_files) < _PARALLEL_MIN_REPORTS
+            or self.validator
+            or (os.cpu_count() or 1) <= 1
+        ):
+            for report_file, stat in zip(report_files, stats):
+                yield self._check(report_file, stat)[0]
+            return
+
+        # 内容が変わっていないレポートはキャッシュから返し、残りだけを並列で解析
+        entries: List[Tuple[Path, Optional[os.stat_result], bool]] = []
+        misses: List[Path] = []
+        for report_file, stat in zip(report_files, stats):
+            report_file = Path(report_file)
+            if stat is None:
+                try:
+                    stat = report_file.stat()
+                except OSError:
+                    # 見つからない等のエラー結果はワーカー側で組み立てる
+                    stat = None
+            hit = stat is not None and self._cached_metrics(str(report_file), stat)
+            entries.append((report_file, stat, bool(hit)))
+            if not hit:
+                misses.append(report_file)
+
+        if len(misses) < _PARALLEL_MIN_REPORTS:
+            for report_file, stat, _ in entries:
+                yield self._check(report_file, stat)[0]
+            return
+
+        with ProcessPoolExecutor() as executor:
+            checked = executor.map(
+                partial(_check_one, config=self.config), misses, chunksize=8
+            )
+            for report_file, stat, hit in entries:
+                if hit:
+                    yield self._check(report_file, stat)[0]
+                    continue
+
+                result, metrics = next(checked)
+                # ワーカーで算出した指標を親プロセスのキャッシュに反映
+                if metrics is not None and stat is not None:
+                    self._cache[str(report_file)] = (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                        metrics,
+                    )
+                yield result
+
     def get_quality_statistics(self) -> Dict[str, Any]:
         """品質チェック統計情報の取得"""
         try:
@@ -404,7 +542,7 @@ class QualityChecker:
                 "config": {
                     "min_word_count": self.config.min_word_count,
                     "min_sources": self.config.min_sources,
-                    "required_sections": self.required_sections,
+                    "required_sections": list(self.required_sections),
                     "strict_validation": self.config.strict_validation,
                 },
                 "validator_available": self.validator is not None,
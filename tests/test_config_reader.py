@@ -0,0 +1,67 @@
+"""
+Config Reader のテスト
+"""
+from src.utils.config_reader import CONFIG_FIELDS, ConfigReader, extract_values
+
+
+def test_extract_values_reads_all_fields():
+    content = "- プロジェクト名: 新規事業\n- 自社名: ACME\n- 業界: IT\n"
+    values = extract_values(content)
+
+    assert values["project_name"] == "新規事業"
+    assert values["company_name"] == "ACME"
+    assert values["industry"] == "IT"
+    # 記載のない項目も空文字で返す
+    assert set(values) == set(CONFIG_FIELDS.values())
+    assert values["division"] == ""
+
+
+def test_extract_values_blank_field_does_not_consume_next_line():
+    values = extract_values("- 事業部門:\n- 自社名: ACME\n- 業界: IT\n")
+
+    assert values["division"] == ""
+    assert values["company_name"] == "ACME"
+    assert values["industry"] == "IT"
+
+
+def test_extract_values_blank_field_with_trailing_spaces():
+    values = extract_values("- 事業部門：  \n- 自社名：ACME\n")
+
+    assert values["division"] == ""
+    assert values["company_name"] == "ACME"
+
+
+def test_extract_values_strips_placeholder_brackets():
+    values = extract_values("- 自社名: [企業名を入力]\n")
+
+    assert values["company_name"] == "企業名を入力"
+
+
+def test_extract_values_prefers_first_block_over_example():
+    content = (
+        "## 1. 基本情報\n"
+        "- 自社名: ACME\n"
+        "- 事業部門:\n"
+        "\n"
+        "---\n"
+        "\n"
+        "## 記入例\n"
+        "- 自社名: テックスタート株式会社\n"
+        "- 事業部門: 新規事業開発部\n"
+        "- 業界: SaaS・クラウドサービス\n"
+    )
+    values = extract_values(content)
+
+    assert values["company_name"] == "ACME"
+    # 空欄の項目は記入例の値で埋めない
+    assert values["division"] == ""
+
+
+def test_load_phase_config_returns_independent_copies():
+    reader = ConfigReader()
+
+    theme = reader.get_theme_info("phase_1", "A")
+    theme["name"] = "変更"
+    reader.load_phase_config()["phase_1"]["themes"].clear()
+
+    assert reader.get_theme_info("phase_1", "A")["name"] != "変更"
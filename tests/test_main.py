@@ -0,0 +1,80 @@
+"""
+BSRSMain のテスト
+"""
+import pytest
+
+from src.main import BSRSMain
+
+
+def test_theme_index_falls_back_to_phase_config():
+    app = BSRSMain()
+
+    assert app.get_phase_for_theme("A") == "phase_1"
+    assert app.get_phase_for_theme("35") == "phase_8"
+    assert app.get_phase_for_theme("Z") == "final_phase"
+    assert app.get_theme_info("A")["name"] == "内部環境・自社アセット評価レポート"
+
+
+def test_theme_menu_lists_shipped_themes():
+    all_themes, lines = BSRSMain()._theme_menu
+
+    assert [theme_id for theme_id, _ in all_themes][:2] == ["A", "B"]
+    assert not any("データ未定義" in line for line in lines)
+
+
+class _RecordingController:
+    def __init__(self):
+        self.calls = []
+
+    def run_single_theme(self, config_data, phase_name, theme_id):
+        self.calls.append((phase_name, theme_id))
+
+
+def test_theme_option_runs_theme_from_phase_config():
+    app = BSRSMain()
+    app.controller = _RecordingController()
+    app.load_project_config = lambda: {"project_name": "テスト"}
+
+    app.run(["--theme", "Z"])
+
+    assert app.controller.calls == [("final_phase", "Z")]
+
+
+def test_theme_option_rejects_unknown_theme():
+    app = BSRSMain()
+    app.controller = _RecordingController()
+    app.load_project_config = lambda: {"project_name": "テスト"}
+
+    with pytest.raises(SystemExit) as excinfo:
+        app.run(["--theme", "999"])
+
+    assert excinfo.value.code == 1
+    assert app.controller.calls == []
+
+
+def test_list_themes_option_prints_theme_names(caplog):
+    with caplog.at_level("INFO", logger="src.main"):
+        BSRSMain().run(["--list-themes"])
+
+    assert "[  Z] 事業戦略 全体サマリーレポート" in caplog.text
+    assert "データ未定義" not in caplog.text
+
+
+def test_quality_check_mode_does_not_report_pass_on_error(tmp_path, caplog):
+    report_dir = tmp_path / "outputs" / "テスト" / "phase_1"
+    report_dir.mkdir(parents=True)
+    (report_dir / "A.md").write_text("# A\n", encoding="utf-8")
+
+    def broken_check_reports(report_paths):
+        raise RuntimeError("pool broken")
+        yield
+
+    app = BSRSMain()
+    app.root_dir = tmp_path
+    app.quality_checker.check_reports = broken_check_reports
+
+    with caplog.at_level("INFO", logger="src.main"):
+        app.quality_check_mode({"project_name": "テスト"})
+
+    assert "pool broken" in caplog.text
+    assert "すべてのレポートが品質基準を満たしています" not in caplog.text
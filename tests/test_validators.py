@@ -0,0 +1,59 @@
+"""
+Quality Checker のテスト
+"""
+from src.utils.validators import QualityChecker
+
+_REPORT = """# テストレポート
+
+## 現状分析
+市場と競合の分析を行った。
+
+## 戦略提言
+- 顧客の獲得
+
+## 実行計画
+- KPIの設定
+
+## 参考文献
+[1] 資料 https://example.com/{index}
+"""
+
+
+def _write_reports(report_dir, count):
+    report_files = []
+    for index in range(count):
+        report_file = report_dir / f"report_{index}.md"
+        report_file.write_text(_REPORT.format(index=index), encoding="utf-8")
+        report_files.append(report_file)
+    return report_files
+
+
+def test_check_reports_keeps_input_order_in_parallel(tmp_path):
+    report_files = _write_reports(tmp_path, 5)
+    checker = QualityChecker()
+
+    results = list(checker.check_reports(report_files))
+
+    assert results == [checker.check_report(path) for path in report_files]
+
+
+def test_check_reports_sequential_for_small_batches(tmp_path):
+    report_files = _write_reports(tmp_path, 2)
+    stats = [path.stat() for path in report_files]
+    checker = QualityChecker()
+
+    results = list(checker.check_reports(report_files, stats))
+
+    assert results == [checker.check_report(path) for path in report_files]
+
+
+def test_check_reports_fills_cache_from_pool(tmp_path, monkeypatch):
+    report_files = _write_reports(tmp_path, 5)
+    checker = QualityChecker()
+
+    first = list(checker.check_reports(report_files))
+    assert set(checker._cache) == {str(path) for path in report_files}
+
+    # 変更のないレポートは再解析しない
+    monkeypatch.setattr(checker, "_analyze", None)
+    assert list(checker.check_reports(report_files)) == first